@@ -0,0 +1,171 @@
+import re
+from datetime import datetime, timedelta
+
+from parameterized import param, parameterized
+
+import dateparser
+from dateparser.compound_relative_parser import CompoundRelativeParser
+from tests import BaseTestCase
+
+
+class TestCompoundRelativeParser(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parser = CompoundRelativeParser()
+        self.base_time = datetime(2024, 1, 15, 10, 0, 0)  # Monday
+
+    @parameterized.expand(
+        [
+            param("上周五", "zh", expected=datetime(2024, 1, 12, 10, 0)),
+            param("下周星期三", "zh", expected=datetime(2024, 1, 24, 10, 0)),
+            param("last friday", "en", expected=datetime(2024, 1, 12, 10, 0)),
+            param("Next Monday", "en-US", expected=datetime(2024, 1, 22, 10, 0)),
+            param("pasado viernes", "es", expected=datetime(2024, 1, 12, 10, 0)),
+            param("prochain lundi", "fr", expected=datetime(2024, 1, 22, 10, 0)),
+            param("nächsten montag", "de", expected=datetime(2024, 1, 22, 10, 0)),
+            param("先週の金曜日", "ja", expected=datetime(2024, 1, 12, 10, 0)),
+            param("прошлый пятница", "ru", expected=datetime(2024, 1, 12, 10, 0)),
+            param("scorso venerdì", "it", expected=datetime(2024, 1, 12, 10, 0)),
+            param("passado sexta", "pt-BR", expected=datetime(2024, 1, 12, 10, 0)),
+            param("지난 주 금요일", "ko", expected=datetime(2024, 1, 12, 10, 0)),
+        ]
+    )
+    def test_week_expressions(self, date_string, language, expected):
+        self.assertEqual(
+            expected, self.parser.parse(date_string, self.base_time, language)
+        )
+        self.assertEqual(expected, self.parser.parse(date_string, self.base_time))
+
+    @parameterized.expand(
+        [
+            # Saturday
+            param("this friday", datetime(2024, 1, 20), expected=datetime(2024, 1, 19)),
+            param(
+                "this saturday", datetime(2024, 1, 20), expected=datetime(2024, 1, 20)
+            ),
+            param("本周一", datetime(2024, 1, 20), expected=datetime(2024, 1, 15)),
+            param("last friday", datetime(2024, 1, 20), expected=datetime(2024, 1, 12)),
+            param("next friday", datetime(2024, 1, 20), expected=datetime(2024, 1, 26)),
+            param("上周五", datetime(2024, 1, 20), expected=datetime(2024, 1, 12)),
+            param("上周日", datetime(2024, 1, 20), expected=datetime(2024, 1, 14)),
+            # Sunday
+            param("下周一", datetime(2024, 1, 21), expected=datetime(2024, 1, 22)),
+            # Tuesday
+            param("上周一", datetime(2024, 1, 16), expected=datetime(2024, 1, 8)),
+            # Wednesday
+            param("本周一", datetime(2024, 1, 17), expected=datetime(2024, 1, 15)),
+            param("this monday", datetime(2024, 1, 17), expected=datetime(2024, 1, 15)),
+            param("下周一", datetime(2024, 1, 17), expected=datetime(2024, 1, 22)),
+            param("next monday", datetime(2024, 1, 17), expected=datetime(2024, 1, 22)),
+        ]
+    )
+    def test_week_expressions_from_other_weekdays(
+        self, date_string, base_time, expected
+    ):
+        self.assertEqual(expected, self.parser.parse(date_string, base_time))
+
+    def test_last_this_and_next_week_are_seven_days_apart(self):
+        weekdays = [
+            "monday",
+            "tuesday",
+            "wednesday",
+            "thursday",
+            "friday",
+            "saturday",
+            "sunday",
+        ]
+        for base_day in range(15, 22):  # Monday 2024-01-15 to Sunday 2024-01-21
+            base_time = datetime(2024, 1, base_day, 10, 0)
+            for weekday in weekdays:
+                last = self.parser.parse(f"last {weekday}", base_time)
+                this = self.parser.parse(f"this {weekday}", base_time)
+                following = self.parser.parse(f"next {weekday}", base_time)
+                self.assertNotEqual(this, following)
+                self.assertEqual(timedelta(days=7), following - this)
+                self.assertEqual(timedelta(days=7), this - last)
+
+    @parameterized.expand(
+        [
+            param("上个月十七号", "zh", expected=datetime(2023, 12, 17, 10, 0)),
+            param("下月二十二号", "zh", expected=datetime(2024, 2, 22, 10, 0)),
+            param("last month 17th", "en", expected=datetime(2023, 12, 17, 10, 0)),
+            param("next month 31", "en", expected=datetime(2024, 2, 29, 10, 0)),
+            param("próximo mes 3", "es", expected=datetime(2024, 2, 3, 10, 0)),
+            param("先月17日", "ja", expected=datetime(2023, 12, 17, 10, 0)),
+            param("다음 달 17일", "ko", expected=datetime(2024, 2, 17, 10, 0)),
+        ]
+    )
+    def test_month_expressions(self, date_string, language, expected):
+        self.assertEqual(
+            expected, self.parser.parse(date_string, self.base_time, language)
+        )
+        self.assertEqual(expected, self.parser.parse(date_string, self.base_time))
+
+    @parameterized.expand(
+        [
+            param("yesterday"),
+            param("last week"),
+            param("上周八"),
+            param("last friday and some garbage"),
+            param("last month 123"),
+        ]
+    )
+    def test_unsupported_expressions_are_not_parsed(self, date_string):
+        self.assertIsNone(self.parser.parse(date_string, self.base_time))
+        self.assertFalse(self.parser.is_applicable(date_string, "en"))
+
+    @parameterized.expand(
+        [
+            param("上周五下午", "zh"),
+            param("last friday 3pm", "en"),
+        ]
+    )
+    def test_expressions_with_trailing_text_are_not_parsed_end_to_end(
+        self, date_string, language
+    ):
+        settings = {"RELATIVE_BASE": self.base_time}
+        self.assertIsNone(
+            dateparser.parse(date_string, languages=[language], settings=settings)
+        )
+
+    def test_repeated_expression_uses_each_base_time(self):
+        self.assertEqual(
+            datetime(2024, 1, 12, 10, 0),
+            self.parser.parse("last friday", self.base_time),
+        )
+        self.assertEqual(
+            datetime(2024, 2, 9, 10, 0),
+            self.parser.parse("last friday", datetime(2024, 2, 12, 10, 0)),
+        )
+
+    def test_weekday_names_are_unique_by_prefix(self):
+        for lang_key, lang_config in self.parser.language_patterns.items():
+            weekday_map = lang_config["weekday_map"]
+            self.assertEqual(
+                len(weekday_map),
+                len(self.parser._weekday_prefix_maps[lang_key]),
+                lang_key,
+            )
+
+    def test_explicit_language_does_not_fall_back_to_other_languages(self):
+        self.assertIsNone(self.parser.parse("上周五", self.base_time, "en"))
+        self.assertFalse(self.parser.is_applicable("上周五", "en"))
+        self.assertTrue(self.parser.is_applicable("上周五", "zh"))
+
+    def test_language_patterns_require_two_capture_groups(self):
+        self.parser.language_patterns = {
+            "en": {
+                "month_pattern": re.compile(r"(last)\s+month\s+(\d{1,2})"),
+                "week_pattern": re.compile(r"(last)\s+(friday)(\s+noon)?"),
+            }
+        }
+        with self.assertRaisesRegex(ValueError, "week_pattern"):
+            self.parser._build_language_parser("en")
+
+    def test_shared_language_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.parser.language_patterns["xx"] = {}
+        with self.assertRaises(TypeError):
+            self.parser.language_patterns["en"]["relative_map"]["previous"] = -1
+        with self.assertRaises(TypeError):
+            self.parser.language_code_map["en"] = ("en",)